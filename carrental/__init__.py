@@ -0,0 +1,4 @@
+"""Car Rental Management System package.
+
+The menu program lives in carrental.cli; run it with ``python -m carrental``.
+"""
@@ -0,0 +1,13 @@
+"""Entry point for ``python -m carrental``."""
+from .cli import INTERACTIVE
+
+try:
+    if INTERACTIVE:
+        # readline and the history setup are only loaded for a terminal session
+        from .interactive import main_loop
+        main_loop()
+    else:
+        from .cli import batch_main
+        batch_main()
+except KeyboardInterrupt:
+    print('\nInterrupted. Bye.')
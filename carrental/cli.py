@@ -0,0 +1,1194 @@
+"""Car Rental Management System (binary file I/O + struct)
+Python 3.10+
+- Fixed-length record files with header (cars.dat, customers.dat, rentals.dat)
+- pack/unpack using struct (little-endian)
+- CRUD menu: Add / Update / Delete (logical) / View
+- Generate text report (report.txt) with 3 example tables (Customer-based, Rental-based, Car summary)
+- Sample data generator (create >=50 car records, sample customers, sample rentals)
+- Uses only Python Standard Library
+"""
+
+from __future__ import annotations
+import struct
+import os
+import sys
+import time
+import datetime
+import atexit
+import re
+import functools
+import mmap
+from collections import namedtuple
+from typing import Tuple, List
+# json and random are only needed by a few menu paths (legacy header migration,
+# View one, sample data), so they are imported inside those functions to keep
+# startup to the prompt short. readline is only used by a terminal session, so it
+# lives in carrental.interactive.
+
+# --- Constants & Formats ---
+HEADER_SIZE = 256  # bytes reserved at start of each .dat file for the header (zero padded)
+ENDIAN = '<'  # little-endian
+
+# cars.dat format: < i i i i f i 12s 12s 16s i i
+# (each format is compiled once into a struct.Struct so pack/unpack skip re-parsing it)
+CARS_STRUCT_FMT = ENDIAN + 'i i i i f i 12s 12s 16s i i'
+_CAR_STRUCT = struct.Struct(CARS_STRUCT_FMT)
+CARS_RECORD_SIZE = _CAR_STRUCT.size
+# byte offsets of single int fields that get patched in place
+_CAR_IS_RENTED_OFFSET = struct.calcsize(ENDIAN + 'i i')
+_CAR_UPDATED_AT_OFFSET = CARS_RECORD_SIZE - struct.calcsize(ENDIAN + 'i')
+
+# customers.dat format: < i i 32s 16s 32s i i
+# fields: cust_id, status, name(32), phone(16), email(32), created_at, updated_at
+CUST_STRUCT_FMT = ENDIAN + 'i i 32s 16s 32s i i'
+_CUST_STRUCT = struct.Struct(CUST_STRUCT_FMT)
+CUST_RECORD_SIZE = _CUST_STRUCT.size
+
+# rentals.dat format: < i i i i i f i i
+# we'll map fields as:
+# rent_id, status, car_id, cust_id, pickup_ts (int), daily_rate (float), days (int), is_returned (int)
+RENT_STRUCT_FMT = ENDIAN + 'i i i i i f i i'
+_RENT_STRUCT = struct.Struct(RENT_STRUCT_FMT)
+RENT_RECORD_SIZE = _RENT_STRUCT.size
+
+# Filenames
+CARS_FILE = 'cars.dat'
+CUST_FILE = 'customers.dat'
+RENT_FILE = 'rentals.dat'
+REPORT_FILE = 'report.txt'
+
+# --- Helpers for fixed-length strings ---
+def str_to_fixed_bytes(s: str, length: int) -> bytes:
+    # no ljust(): the struct 's' codes zero-pad short values while packing, and
+    # slicing a short bytes object returns it unchanged, so this is one allocation
+    return s.encode('utf-8')[:length]
+
+def fixed_bytes_to_str(b: bytes) -> str:
+    return b.rstrip(b'\x00').decode('utf-8', errors='ignore')
+
+# --- Date helpers ---
+@functools.lru_cache(maxsize=4096)
+def _fmt_day(ts: int, days: int = 0) -> str:
+    # pickups are local midnights, so many rentals share a timestamp; keyed on the
+    # raw timestamp (not ts // 86400) so the local-time date is kept exactly
+    return (datetime.date.fromtimestamp(ts) + datetime.timedelta(days=days)).strftime('%Y-%m-%d')
+
+# --- Header management ---
+# Headers are read from disk once and then kept here. Record writes update the cached
+# dict and mark it dirty. A durable write (the default) syncs that file right away with
+# sync_file(); batch writers pass durable=False and sync once at the end, and
+# flush_headers() writes whatever is still dirty at exit.
+_headers: dict[str, dict] = {}
+_dirty_headers: set[str] = set()
+
+# Header layout: magic, record_size, count, next_id, capacity, created_at,
+# last_updated, free_count. The rest of the HEADER_SIZE block stays zero.
+_HDR = struct.Struct(ENDIAN + '8s I I I I I I I')
+_HDR_MAGIC = b'CRLv0001'
+_HDR_FIELDS = ('record_size', 'count', 'next_id', 'capacity', 'created_at', 'last_updated', 'free_count')
+# Files written by older versions carry a JSON header. With this flag on they are
+# still read, and rewritten in the struct layout the next time the header is flushed.
+MIGRATE_JSON_HEADERS = True
+
+def _pack_header(meta: dict) -> bytes:
+    return _HDR.pack(_HDR_MAGIC, *(int(meta.get(k, 0)) for k in _HDR_FIELDS))
+
+def write_header(filename: str, meta: dict):
+    raw = _pack_header(meta)
+    rf = _record_files.get(filename)
+    if rf is not None:
+        rf.write_header_bytes(raw)
+        return
+    with open(filename, 'r+b') as f:
+        f.seek(0)
+        f.write(raw)
+        f.write(b'\x00' * (HEADER_SIZE - len(raw)))
+        f.flush(); os.fsync(f.fileno())
+
+def read_header(filename: str) -> dict:
+    meta = _headers.get(filename)
+    if meta is None:
+        # an empty result is cached too, so ensure_file can fill it in place for
+        # callers that already hold it
+        meta = _headers[filename] = _load_header(filename)
+    return meta
+
+def _load_header(filename: str) -> dict:
+    if not os.path.exists(filename):
+        return {}
+    with open(filename, 'rb') as f:
+        data = f.read(HEADER_SIZE)
+    if data[:len(_HDR_MAGIC)] == _HDR_MAGIC and len(data) >= _HDR.size:
+        return dict(zip(_HDR_FIELDS, _HDR.unpack_from(data)[1:]))
+    if not MIGRATE_JSON_HEADERS:
+        return {}
+    import json
+    try:
+        s = data.split(b'\x00', 1)[0].decode('utf-8')
+        if not s:
+            return {}
+        meta = json.loads(s)
+    except Exception:
+        return {}
+    _dirty_headers.add(filename)
+    return meta
+
+def _touch_header(filename: str, meta: dict):
+    meta['last_updated'] = int(time.time())
+    _headers[filename] = meta
+    _dirty_headers.add(filename)
+    rf = _record_files.get(filename)
+    if rf is not None:
+        rf.generation += 1  # every record write ends here, so cached renders go stale
+
+def sync_file(filename: str):
+    # one header write + fsync covers every record written to the file so far
+    if filename in _dirty_headers:
+        _dirty_headers.discard(filename)
+        write_header(filename, _headers[filename])
+
+def flush_headers():
+    for filename in sorted(_dirty_headers):
+        write_header(filename, _headers[filename])
+    _dirty_headers.clear()
+
+atexit.register(flush_headers)
+
+def ensure_file(filename: str, record_size: int):
+    if _headers.get(filename):
+        return  # header already created or loaded this session, no need to stat again
+    try:
+        size = os.stat(filename).st_size
+    except FileNotFoundError:
+        size = -1
+    if size >= HEADER_SIZE:
+        return
+    # missing, or too short to hold even the header (e.g. an empty file): no record
+    # can be in it, so (re)create it with a fresh header, which cannot be mmapped otherwise
+    with open(filename, 'wb') as f:
+        meta = _headers.setdefault(filename, {})
+        meta.clear()
+        meta.update({
+            'record_size': record_size,
+            'count': 0,
+            'next_id': 1001,
+            'capacity': 0,
+            'created_at': int(time.time()),
+            'last_updated': 0,
+            'free_count': 0
+        })
+        raw = _pack_header(meta)
+        f.write(raw)
+        f.write(b'\x00' * (HEADER_SIZE - len(raw)))
+        f.flush(); os.fsync(f.fileno())
+
+# --- Record types ---
+# Records stay as the flat tuples Struct.unpack returns. Text fields keep their raw
+# fixed-length bytes and are decoded with fixed_bytes_to_str only when displayed.
+Car = namedtuple('Car', 'car_id status is_rented year daily_rate_thb odometer_km '
+                        'license_plate brand model created_at updated_at')
+Customer = namedtuple('Customer', 'cust_id status name phone email created_at updated_at')
+Rental = namedtuple('Rental', 'rent_id status car_id cust_id pickup_ts daily_rate days is_returned')
+
+# --- Cars pack/unpack ---
+def pack_car(car: Car) -> bytes:
+    return _CAR_STRUCT.pack(*car)
+
+def unpack_car(raw, offset: int = 0) -> Car:
+    return Car._make(_CAR_STRUCT.unpack_from(raw, offset))
+
+# text fields and their fixed widths, for converting to/from an editable dict
+_CAR_TEXT = {'license_plate': 12, 'brand': 12, 'model': 16}
+
+def car_to_dict(car: Car) -> dict:
+    d = car._asdict()
+    for k in _CAR_TEXT:
+        d[k] = fixed_bytes_to_str(d[k])
+    return d
+
+def car_from_dict(d: dict) -> Car:
+    d = dict(d)
+    for k, length in _CAR_TEXT.items():
+        d[k] = str_to_fixed_bytes(d.get(k, ''), length)
+    return Car(**d)
+
+# --- Customers pack/unpack ---
+def pack_customer(cust: Customer) -> bytes:
+    return _CUST_STRUCT.pack(*cust)
+
+def unpack_customer(raw, offset: int = 0) -> Customer:
+    return Customer._make(_CUST_STRUCT.unpack_from(raw, offset))
+
+# --- Rentals pack/unpack ---
+def pack_rental(r: Rental) -> bytes:
+    return _RENT_STRUCT.pack(*r)
+
+def unpack_rental(raw, offset: int = 0) -> Rental:
+    return Rental._make(_RENT_STRUCT.unpack_from(raw, offset))
+
+# --- Low-level record access ---
+class RecordFile:
+    """A .dat file kept open for the whole session behind one writable mmap.
+
+    Records are read and written by slicing the map, so no call pays for an
+    open()/seek(). The file is preallocated in whole slots: when 'count' reaches
+    the header 'capacity' the capacity doubles (at least MIN_CAPACITY), so
+    appends almost never extend the file. Slots past 'count' are zero filled.
+    'generation' goes up on every change to the file's records or header, and
+    rendered views are cached against it.
+    """
+    MIN_CAPACITY = 64
+
+    def __init__(self, filename: str, record_size: int):
+        self.filename = filename
+        self.record_size = record_size
+        self.generation = 0
+        # a bare descriptor: all I/O goes through the map, which has no shared file
+        # position, so there is nothing to seek and readers never contend for one
+        self.fd = os.open(filename, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+        self.mm = mmap.mmap(self.fd, 0, access=mmap.ACCESS_WRITE)
+
+    @property
+    def capacity(self) -> int:
+        return (len(self.mm) - HEADER_SIZE) // self.record_size
+
+    def _reserve(self, end: int):
+        if end <= len(self.mm):
+            return
+        capacity = max(self.MIN_CAPACITY, self.capacity)
+        while HEADER_SIZE + capacity * self.record_size < end:
+            capacity *= 2
+        new_size = HEADER_SIZE + capacity * self.record_size
+        # remap rather than mm.resize(): resize is missing on some platforms and
+        # Windows refuses to truncate a file that still has a mapping open
+        self.mm.close()
+        os.ftruncate(self.fd, new_size)
+        self.mm = mmap.mmap(self.fd, new_size, access=mmap.ACCESS_WRITE)
+        meta = read_header(self.filename)
+        meta['capacity'] = capacity
+        _touch_header(self.filename, meta)
+
+    def reserve(self, slots: int) -> mmap.mmap:
+        # make room for `slots` records and return the (possibly new) map
+        self._reserve(get_record_offset(slots, self.record_size))
+        return self.mm
+
+    def write_at(self, index: int, record_bytes: bytes):
+        off = get_record_offset(index, self.record_size)
+        self._reserve(off + len(record_bytes))
+        self.mm[off:off + len(record_bytes)] = record_bytes
+
+    def write_header_bytes(self, raw: bytes):
+        self.mm[:HEADER_SIZE] = raw.ljust(HEADER_SIZE, b'\x00')
+        self.mm.flush()
+        os.fsync(self.fd)
+
+_record_files: dict[str, RecordFile] = {}
+
+def _record_file(filename: str, record_size: int) -> RecordFile:
+    rf = _record_files.get(filename)
+    if rf is None:
+        ensure_file(filename, record_size)
+        rf = _record_files[filename] = RecordFile(filename, record_size)
+    return rf
+
+def get_record_offset(index: int, record_size: int) -> int:
+    return HEADER_SIZE + index * record_size
+
+# One appender per record type: each packs straight into its file's map with its own
+# Struct and record size, so the hot path has no record_size argument or dispatch.
+def append_car(car: Car, durable: bool = True) -> int:
+    meta = read_header(CARS_FILE)
+    idx = meta.get('count', 0)
+    mm = _record_file(CARS_FILE, CARS_RECORD_SIZE).reserve(idx + 1)
+    _CAR_STRUCT.pack_into(mm, HEADER_SIZE + idx * CARS_RECORD_SIZE, *car)
+    _appended(CARS_FILE, meta, idx, car.car_id, durable)
+    return idx
+
+def append_customer(cust: Customer, durable: bool = True) -> int:
+    meta = read_header(CUST_FILE)
+    idx = meta.get('count', 0)
+    mm = _record_file(CUST_FILE, CUST_RECORD_SIZE).reserve(idx + 1)
+    _CUST_STRUCT.pack_into(mm, HEADER_SIZE + idx * CUST_RECORD_SIZE, *cust)
+    _appended(CUST_FILE, meta, idx, cust.cust_id, durable)
+    return idx
+
+def append_rental(rent: Rental, durable: bool = True) -> int:
+    meta = read_header(RENT_FILE)
+    idx = meta.get('count', 0)
+    mm = _record_file(RENT_FILE, RENT_RECORD_SIZE).reserve(idx + 1)
+    _RENT_STRUCT.pack_into(mm, HEADER_SIZE + idx * RENT_RECORD_SIZE, *rent)
+    _appended(RENT_FILE, meta, idx, rent.rent_id, durable)
+    return idx
+
+def _appended(filename: str, meta: dict, idx: int, rec_id: int, durable: bool):
+    ids = _id_index.get(filename)
+    if ids is not None:
+        ids.setdefault(rec_id, idx)
+    meta['count'] = idx + 1
+    meta['next_id'] = meta.get('next_id', 1001) + 1
+    _touch_header(filename, meta)
+    if durable:
+        sync_file(filename)
+
+def append_records(filename: str, buf: bytes, record_size: int, durable: bool = True):
+    """Append a contiguous block of packed records with one write and one header update."""
+    meta = read_header(filename)
+    count = meta.get('count', 0)
+    n = len(buf) // record_size
+    _record_file(filename, record_size).write_at(count, buf)
+    for i in range(n):
+        _index_record(filename, count + i, buf, i * record_size)
+    meta['count'] = count + n
+    meta['next_id'] = meta.get('next_id', 1001) + n
+    _touch_header(filename, meta)
+    if durable:
+        sync_file(filename)
+
+def write_record_at(filename: str, index: int, record_bytes: bytes, record_size: int, durable: bool = True):
+    _record_file(filename, record_size).write_at(index, record_bytes)
+    _index_record(filename, index, record_bytes)
+    _touch_header(filename, read_header(filename))
+    if durable:
+        sync_file(filename)
+
+def read_record_at(filename: str, index: int, record_size: int) -> bytes | None:
+    mm = _record_file(filename, record_size).mm
+    if index >= _mapped_count(mm, read_header(filename).get('count', 0), record_size):
+        return None
+    offset = get_record_offset(index, record_size)
+    return mm[offset:offset + record_size]
+
+def _read_data(filename: str, record_size: int) -> bytes:
+    # the whole data region in one slice, trimmed to whole records for iter_unpack
+    mm = _record_file(filename, record_size).mm
+    count = _mapped_count(mm, read_header(filename).get('count', 0), record_size)
+    return mm[HEADER_SIZE:HEADER_SIZE + count * record_size]
+
+def _mapped_count(mm: mmap.mmap, count: int, record_size: int) -> int:
+    # never walk past the end of the file even if the header count is larger
+    return max(0, min(count, (len(mm) - HEADER_SIZE) // record_size))
+
+# --- In-memory id -> index lookup ---
+# every record type starts with its int id, so one tiny struct reads just that field
+_ID_STRUCT = struct.Struct(ENDIAN + 'i')
+_id_index: dict[str, dict[int, int]] = {}
+
+def _get_id_index(filename: str, record_size: int) -> dict[int, int]:
+    ids = _id_index.get(filename)
+    if ids is None:
+        ids = {}
+        meta = read_header(filename)
+        mm = _record_file(filename, record_size).mm
+        for idx in range(_mapped_count(mm, meta.get('count', 0), record_size)):
+            # setdefault keeps the first slot for a duplicated id, like the old linear scan
+            ids.setdefault(_ID_STRUCT.unpack_from(mm, HEADER_SIZE + idx * record_size)[0], idx)
+        _id_index[filename] = ids
+    return ids
+
+def _index_record(filename: str, index: int, record_bytes: bytes, offset: int = 0):
+    ids = _id_index.get(filename)
+    if ids is not None:
+        ids.setdefault(_ID_STRUCT.unpack_from(record_bytes, offset)[0], index)
+
+# --- Free slot bitmap ---
+# One bit per slot, set while the slot holds a logically deleted record so the next
+# reuse_free_slot() can reuse it instead of growing the file. The bits are derived from
+# the status fields, so the map is rebuilt the first time a file needs it.
+_STATUS_OFFSET = _ID_STRUCT.size  # every record type is <id, status, ...>
+_freemaps: dict[str, bytearray] = {}
+
+def _get_freemap(filename: str, record_size: int) -> bytearray:
+    fm = _freemaps.get(filename)
+    if fm is None:
+        meta = read_header(filename)
+        mm = _record_file(filename, record_size).mm
+        count = _mapped_count(mm, meta.get('count', 0), record_size)
+        fm = bytearray((count + 63) // 64 * 8)  # whole 64-bit words
+        free = 0
+        for idx in range(count):
+            if _ID_STRUCT.unpack_from(mm, HEADER_SIZE + idx * record_size + _STATUS_OFFSET)[0] == 0:
+                fm[idx >> 3] |= 1 << (idx & 7)
+                free += 1
+        meta['free_count'] = free
+        _freemaps[filename] = fm
+    return fm
+
+def _iter_free(fm: bytearray):
+    # scan a word at a time, lowest slot first; w & -w isolates the lowest set bit
+    for off in range(0, len(fm), 8):
+        w = int.from_bytes(fm[off:off + 8], 'little')
+        while w:
+            low = w & -w
+            yield off * 8 + low.bit_length() - 1
+            w ^= low
+
+def mark_slot_free(filename: str, index: int, record_size: int):
+    fm = _get_freemap(filename, record_size)
+    need = (index // 64 + 1) * 8
+    if len(fm) < need:
+        fm.extend(bytes(need - len(fm)))
+    if not fm[index >> 3] & (1 << (index & 7)):
+        fm[index >> 3] |= 1 << (index & 7)
+        meta = read_header(filename)
+        meta['free_count'] = meta.get('free_count', 0) + 1
+        _touch_header(filename, meta)
+
+def reuse_free_slot(filename: str, record_bytes: bytes, record_size: int, durable: bool = True,
+                    keep_ids=frozenset()) -> int | None:
+    """Write a new record into the lowest free slot; returns None if no slot is free.
+
+    Reusing a slot erases the logically deleted record in it for good: it no longer
+    shows as Deleted and its id is unknown afterwards. Slots whose id is in keep_ids
+    (e.g. cars that rentals still refer to) are therefore never reused.
+    """
+    fm = _get_freemap(filename, record_size)
+    mm = _record_file(filename, record_size).mm
+    for idx in _iter_free(fm):
+        old_id = _ID_STRUCT.unpack_from(mm, get_record_offset(idx, record_size))[0]
+        if old_id not in keep_ids:
+            break
+    else:
+        return None
+    fm[idx >> 3] &= ~(1 << (idx & 7))
+    # the deleted record's id no longer lives in this slot
+    ids = _id_index.get(filename)
+    if ids is not None and ids.get(old_id) == idx:
+        del ids[old_id]
+    meta = read_header(filename)
+    meta['next_id'] = meta.get('next_id', 1001) + 1
+    meta['free_count'] = max(0, meta.get('free_count', 0) - 1)
+    # header changes first, so a durable write syncs them together with the record
+    write_record_at(filename, idx, record_bytes, record_size, durable)
+    return idx
+
+# --- Persisted id indexes ---
+# The id -> slot dicts are saved at exit and reused on the next run for every data
+# file whose stamp still matches, so a warm start skips the rescans. The stamp is
+# (mtime_ns, size) plus the header's count, next_id and free_count: every append,
+# reuse and delete changes one of those and sync_file puts it on disk at once, so a
+# change made within the mtime granularity without growing the file still shows.
+# The cache is a plain struct layout rather than a pickle, so loading a file found in
+# the working directory can never run code:
+#   magic, file count, then per file: name length, the five stamp fields, pair
+#   count, the utf-8 name and that many (id, slot) pairs.
+STATE_DIR = '.cache'
+STATE_FILE = os.path.join(STATE_DIR, 'state.bin')
+_STATE_MAGIC = b'CRLidx02'
+_STATE_HDR = struct.Struct('<8s I')
+_STATE_ENTRY = struct.Struct('<H q q I I I I')
+_STATE_PAIR = struct.Struct('<i i')
+
+def _file_stamp(filename: str) -> Tuple[int, ...]:
+    st = os.stat(filename)
+    meta = read_header(filename)
+    return (st.st_mtime_ns, st.st_size,
+            meta.get('count', 0), meta.get('next_id', 0), meta.get('free_count', 0))
+
+def _parse_state(data: bytes) -> dict[str, Tuple[Tuple[int, ...], dict[int, int]]]:
+    magic, nfiles = _STATE_HDR.unpack_from(data)
+    if magic != _STATE_MAGIC:
+        raise ValueError('not a state file')
+    record_sizes = dict(DATA_FILES)
+    state = {}
+    off = _STATE_HDR.size
+    for _ in range(nfiles):
+        name_len, *stamp, npairs = _STATE_ENTRY.unpack_from(data, off)
+        off += _STATE_ENTRY.size
+        filename = data[off:off + name_len].decode('utf-8')
+        off += name_len
+        end = off + npairs * _STATE_PAIR.size
+        if filename not in record_sizes or end > len(data):
+            raise ValueError('bad entry')
+        ids = dict(_STATE_PAIR.iter_unpack(data[off:end]))
+        slots = (stamp[1] - HEADER_SIZE) // record_sizes[filename]
+        if len(ids) != npairs or any(not 0 <= i < slots for i in ids.values()):
+            raise ValueError('bad index')
+        state[filename] = (tuple(stamp), ids)
+        off = end
+    if off != len(data):
+        raise ValueError('trailing data')
+    return state
+
+def load_state():
+    try:
+        with open(STATE_FILE, 'rb') as f:
+            state = _parse_state(f.read())
+    except Exception:
+        return  # missing or damaged cache: every index is rebuilt on first use
+    for filename, (stamp, ids) in state.items():
+        try:
+            if _file_stamp(filename) == stamp:
+                _id_index.setdefault(filename, ids)
+        except OSError:
+            pass
+
+def save_state():
+    flush_headers()  # header writes touch the files, so stamp them afterwards
+    parts = []
+    nfiles = 0
+    for filename, ids in _id_index.items():
+        try:
+            stamp = _file_stamp(filename)
+        except OSError:
+            continue
+        name = filename.encode('utf-8')
+        parts.append(_STATE_ENTRY.pack(len(name), *stamp, len(ids)) + name)
+        parts.extend(_STATE_PAIR.pack(k, v) for k, v in ids.items())
+        nfiles += 1
+    try:
+        os.makedirs(STATE_DIR, exist_ok=True)
+        tmp = STATE_FILE + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(_STATE_HDR.pack(_STATE_MAGIC, nfiles))
+            f.write(b''.join(parts))
+        os.replace(tmp, STATE_FILE)
+    except OSError:
+        pass  # the cache is only an optimisation
+
+# --- Find helpers ---
+def find_car_index_by_id(car_id: int) -> int | None:
+    return _get_id_index(CARS_FILE, CARS_RECORD_SIZE).get(car_id)
+
+def find_customer_index_by_id(cust_id: int) -> int | None:
+    return _get_id_index(CUST_FILE, CUST_RECORD_SIZE).get(cust_id)
+
+def find_rental_index_by_id(rent_id: int) -> int | None:
+    return _get_id_index(RENT_FILE, RENT_RECORD_SIZE).get(rent_id)
+
+# --- High-level Cars CRUD (unchanged) ---
+def _rented_car_ids() -> set[int]:
+    return {car_id for _, _, car_id, *_ in _RENT_STRUCT.iter_unpack(_read_data(RENT_FILE, RENT_RECORD_SIZE))}
+
+def add_car_interactive():
+    meta = read_header(CARS_FILE)
+    next_id = meta.get('next_id', 1001)
+    car = {}
+    car['car_id'] = next_id
+    car['status'] = 1
+    car['is_rented'] = 0
+    try:
+        car['year'] = int(input('Year (e.g., 2021): ').strip())
+    except:
+        car['year'] = 2020
+    try:
+        car['daily_rate_thb'] = float(input('Daily rate (THB): ').strip())
+    except:
+        car['daily_rate_thb'] = 1000.0
+    try:
+        car['odometer_km'] = int(input('Odometer (km): ').strip())
+    except:
+        car['odometer_km'] = 0
+    car['license_plate'] = input('License plate: ').strip()
+    car['brand'] = input('Brand: ').strip()
+    car['model'] = input('Model: ').strip()
+    ts = int(time.time())
+    car['created_at'] = ts
+    car['updated_at'] = ts
+    new_car = car_from_dict(car)
+    # a deleted car that rentals still name keeps its record so reports can show it
+    if reuse_free_slot(CARS_FILE, pack_car(new_car), CARS_RECORD_SIZE, keep_ids=_rented_car_ids()) is None:
+        append_car(new_car)
+    print(f"Added car_id={car['car_id']}")
+
+def update_car_interactive():
+    try:
+        cid = int(input('Enter car_id to update: ').strip())
+    except:
+        print('Invalid id'); return
+    idx = find_car_index_by_id(cid)
+    if idx is None:
+        print('Car not found'); return
+    raw = read_record_at(CARS_FILE, idx, CARS_RECORD_SIZE)
+    car = car_to_dict(unpack_car(raw))
+    print('Current:', car)
+    s = input(f"Year [{car['year']}]: ").strip()
+    if s: car['year'] = int(s)
+    s = input(f"Daily rate [{car['daily_rate_thb']}]: ").strip()
+    if s: car['daily_rate_thb'] = float(s)
+    s = input(f"Odometer [{car['odometer_km']}]: ").strip()
+    if s: car['odometer_km'] = int(s)
+    s = input(f"License plate [{car['license_plate']}]: ").strip()
+    if s: car['license_plate'] = s
+    s = input(f"Brand [{car['brand']}]: ").strip()
+    if s: car['brand'] = s
+    s = input(f"Model [{car['model']}]: ").strip()
+    if s: car['model'] = s
+    car['updated_at'] = int(time.time())
+    raw2 = pack_car(car_from_dict(car))
+    write_record_at(CARS_FILE, idx, raw2, CARS_RECORD_SIZE)
+    print('Updated')
+
+def delete_car_interactive():
+    try:
+        cid = int(input('Enter car_id to delete (logical): ').strip())
+    except:
+        print('Invalid id'); return
+    idx = find_car_index_by_id(cid)
+    if idx is None:
+        print('Car not found'); return
+    raw = read_record_at(CARS_FILE, idx, CARS_RECORD_SIZE)
+    car = unpack_car(raw)
+    if car.status == 0:
+        print('Already deleted'); return
+    car = car._replace(status=0, updated_at=int(time.time()))
+    mark_slot_free(CARS_FILE, idx, CARS_RECORD_SIZE)
+    write_record_at(CARS_FILE, idx, pack_car(car), CARS_RECORD_SIZE)
+    print('Deleted (logical)')
+
+# Table templates for the view_all_* screens. Each table is joined into one string and
+# written with a single sys.stdout.write instead of one print() per row.
+# ('{:<10.10}' pads and truncates in one step, replacing the old s[:10] slices.)
+_CARS_RULE = '+------+------------+-----------+-----------+------+----------+--------+'
+_CARS_HEAD = _CARS_RULE + '\n| ID   | Plate      | Brand     | Model     | Year | Rate     | Status |\n' + _CARS_RULE
+_CAR_ROW_FMT = '| {:<4} | {:<10.10} | {:<9.9} | {:<9.9} | {:<4} | {:<8.2f} | {:<6}|'
+
+def _format_table(head: str, rows, rule: str) -> str:
+    out = [head]
+    out.extend(rows)
+    out.append(rule)
+    return '\n'.join(out) + '\n'
+
+def _write_table(head: str, rows, rule: str):
+    sys.stdout.write(_format_table(head, rows, rule))
+
+# Car views are rendered once per cars.dat generation, so repeating a view with
+# no write in between only costs a cache hit.
+def _cars_generation() -> int:
+    return _record_file(CARS_FILE, CARS_RECORD_SIZE).generation
+
+@functools.lru_cache(maxsize=8)
+def _render_all_cars(filter_active: bool | None, generation: int) -> str:
+    want = None if filter_active is None else (1 if filter_active else 0)
+    return _format_table(_CARS_HEAD, (
+        _CAR_ROW_FMT.format(c.car_id, fixed_bytes_to_str(c.license_plate), fixed_bytes_to_str(c.brand),
+                            fixed_bytes_to_str(c.model), c.year, c.daily_rate_thb,
+                            'Active' if c.status==1 else 'Deleted')
+        for c in map(Car._make, _CAR_STRUCT.iter_unpack(_read_data(CARS_FILE, CARS_RECORD_SIZE)))
+        if want is None or c.status == want
+    ), _CARS_RULE)
+
+def view_all_cars(filter_active: bool | None = None):
+    sys.stdout.write(_render_all_cars(filter_active, _cars_generation()))
+
+@functools.lru_cache(maxsize=32)
+def _render_one_car(car_id: int, generation: int) -> str | None:
+    idx = find_car_index_by_id(car_id)
+    if idx is None:
+        return None
+    car = unpack_car(read_record_at(CARS_FILE, idx, CARS_RECORD_SIZE))
+    import json
+    return json.dumps(car_to_dict(car), ensure_ascii=False, indent=2) + '\n'
+
+def view_one_car():
+    try:
+        cid = int(input('Enter car_id to view: ').strip())
+    except:
+        print('Invalid id'); return
+    text = _render_one_car(cid, _cars_generation())
+    if text is None:
+        print('Not found'); return
+    sys.stdout.write(text)
+
+# --- Customers (simple CRUD-like add/view) ---
+def add_customer(name: str, phone: str = '', email: str = '') -> int:
+    ensure_file(CUST_FILE, CUST_RECORD_SIZE)
+    meta = read_header(CUST_FILE)
+    cust_id = meta.get('next_id', 1001)
+    ts = int(time.time())
+    cust = Customer(cust_id, 1, str_to_fixed_bytes(name, 32), str_to_fixed_bytes(phone, 16),
+                    str_to_fixed_bytes(email, 32), ts, ts)
+    append_customer(cust)
+    return cust_id
+
+_CUST_RULE = '+------+-------------------------------+----------------+--------------------+'
+_CUST_HEAD = _CUST_RULE + '\n| ID   | Name                          | Phone          | Email              |\n' + _CUST_RULE
+_CUST_ROW_FMT = '| {:<4} | {:<30.30} | {:<14.14} | {:<18.18} |'
+
+def view_all_customers():
+    _write_table(_CUST_HEAD, (
+        _CUST_ROW_FMT.format(c.cust_id, fixed_bytes_to_str(c.name), fixed_bytes_to_str(c.phone),
+                             fixed_bytes_to_str(c.email))
+        for c in map(Customer._make, _CUST_STRUCT.iter_unpack(_read_data(CUST_FILE, CUST_RECORD_SIZE)))
+    ), _CUST_RULE)
+
+# --- Rentals (create/view) ---
+def add_rental(car_id: int, cust_id: int, pickup_dt: datetime.date, days: int, daily_rate: float):
+    ensure_file(RENT_FILE, RENT_RECORD_SIZE)
+    meta = read_header(RENT_FILE)
+    rent_id = meta.get('next_id', 1001)
+    pickup_ts = int(time.mktime(pickup_dt.timetuple()))
+    rent = Rental(rent_id, 1, car_id, cust_id, pickup_ts, float(daily_rate), int(days), 0)
+    append_rental(rent)
+    # mark car as rented
+    idx = find_car_index_by_id(car_id)
+    if idx is not None:
+        car = unpack_car(read_record_at(CARS_FILE, idx, CARS_RECORD_SIZE))
+        car = car._replace(is_rented=1, updated_at=int(time.time()))
+        write_record_at(CARS_FILE, idx, pack_car(car), CARS_RECORD_SIZE)
+    return rent_id
+
+_RENT_RULE = '+------+--------+--------+---------------------+------+---------+'
+_RENT_HEAD = _RENT_RULE + '\n| Rent | Car ID | CustID | Pick-up (YYYY-MM-DD) | Days | Returned |\n' + _RENT_RULE
+_RENT_ROW_FMT = '| {:<4} | {:<6} | {:<6} | {:<19} | {:<4} | {:<7} |'
+
+def view_all_rentals():
+    _write_table(_RENT_HEAD, (
+        _RENT_ROW_FMT.format(r.rent_id, r.car_id, r.cust_id, _fmt_day(r.pickup_ts), r.days, r.is_returned)
+        for r in map(Rental._make, _RENT_STRUCT.iter_unpack(_read_data(RENT_FILE, RENT_RECORD_SIZE)))
+    ), _RENT_RULE)
+
+# --- Report generation (3 example sections) ---
+_REPORT_CAR_ROW_FMT = '| {:<5} | {:<10.10} | {:<9.9} | {:<9.9} | {:<4} | {:<10.2f} | {:<7} |'
+
+def generate_report_all():
+    """Generate report.txt with 3 example tables:
+       A) Customer-based rentals
+       B) Rental detail list (periods)
+       C) Car summary (existing)
+    """
+    # read data from files
+    ensure_file(CARS_FILE, CARS_RECORD_SIZE)
+    ensure_file(CUST_FILE, CUST_RECORD_SIZE)
+    ensure_file(RENT_FILE, RENT_RECORD_SIZE)
+
+    # load each file with one read; text fields stay raw bytes until a row is printed
+    cars = {v[0]: v for v in map(Car._make, _CAR_STRUCT.iter_unpack(_read_data(CARS_FILE, CARS_RECORD_SIZE)))}
+    customers = {v[0]: v for v in map(Customer._make, _CUST_STRUCT.iter_unpack(_read_data(CUST_FILE, CUST_RECORD_SIZE)))}
+    rentals = list(map(Rental._make, _RENT_STRUCT.iter_unpack(_read_data(RENT_FILE, RENT_RECORD_SIZE))))
+
+    # Section A: Customer-based report
+    lines: List[str] = []
+    now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    lines.append('Car Rental Management System - Sample Reports')
+    lines.append(f'Generated At: {now}')
+    lines.append('')
+    lines.append('=== Report A: Rentals by Customer (sample) ===')
+    lines.append('+-------------+-------------------------+----------------+------------+------------+------+---------------+')
+    lines.append('| Customer ID | Customer Name           | Car Rented     | Pick-up    | Return     | Days | Total Charge  |')
+    lines.append('+-------------+-------------------------+----------------+------------+------------+------+---------------+')
+
+    # pick up to 3 example rentals (if exist), else create mock examples from rentals list
+    example_rows = []
+    # prefer newest rentals to show variety
+    rentals_sorted = sorted(rentals, key=lambda x: x.rent_id)
+    # take up to 3 real rentals
+    for r in rentals_sorted[:3]:
+        cust = customers.get(r.cust_id)
+        car = cars.get(r.car_id)
+        total = r.daily_rate * r.days
+        example_rows.append((
+            f"C{r.cust_id}",
+            fixed_bytes_to_str(cust.name) if cust else 'Unknown',
+            f"{fixed_bytes_to_str(car.brand)} {fixed_bytes_to_str(car.model)}".strip() if car else 'Unknown Unknown',
+            _fmt_day(r.pickup_ts),
+            _fmt_day(r.pickup_ts, r.days),
+            str(r.days),
+            f"{total:.2f}"
+        ))
+    # if not enough rentals, fill with mock examples
+    if len(example_rows) < 3:
+        needed = 3 - len(example_rows)
+        sample_customers = [
+            ("C001","Mr. Somchai Jaidee"),
+            ("C002","Ms. Kamoltip Nimnuan"),
+            ("C003","Mr. Anan Srisuk"),
+            ("C004","Ms. Lina Park")
+        ]
+        sample_cars = ["Toyota Vios","Honda Civic","Isuzu D-Max","Mazda 2"]
+        base_date = datetime.date.today() - datetime.timedelta(days=9)
+        for i in range(needed):
+            cid, cname = sample_customers[i]
+            car = sample_cars[i]
+            pickup = base_date + datetime.timedelta(days=i*2)
+            days = [3,2,6][i%3]
+            rate = [900.0,1200.0,1500.0][i%3]
+            total = rate*days
+            example_rows.append((cid, cname, car, pickup.strftime('%Y-%m-%d'), (pickup + datetime.timedelta(days=days)).strftime('%Y-%m-%d'), str(days), f"{total:.2f}"))
+
+    for er in example_rows:
+        lines.append(f"| {er[0]:<11} | {er[1][:23]:<23} | {er[2][:14]:<14} | {er[3]:<10} | {er[4]:<10} | {er[5]:<4} | {er[6]:>13} |")
+    lines.append('+-------------+-------------------------+----------------+------------+------------+------+---------------+')
+    lines.append('')
+
+    # Section B: Rental detail list (example)
+    lines.append('=== Report B: Rental Details (sample) ===')
+    lines.append('+--------+---------+-------------+------------+------------+------+----------+')
+    lines.append('| RentID | Car ID  | Customer ID | Pick-up    | Return     | Days | Returned |')
+    lines.append('+--------+---------+-------------+------------+------------+------+----------+')
+
+    # show up to 6 rentals (real or mock)
+    detail_rows = rentals_sorted[:6]
+    # if none, create mock as above
+    if not detail_rows:
+        mock = [
+            Rental(1101, 1, 1001, 1001, int(time.mktime((datetime.date.today()-datetime.timedelta(days=7)).timetuple())), 900.0, 3, 1),
+            Rental(1102, 1, 1002, 1002, int(time.mktime((datetime.date.today()-datetime.timedelta(days=5)).timetuple())), 1200.0, 2, 1),
+            Rental(1103, 1, 1003, 1003, int(time.mktime((datetime.date.today()-datetime.timedelta(days=10)).timetuple())), 1500.0, 6, 0)
+        ]
+        detail_rows = mock
+
+    for r in detail_rows:
+        lines.append(f"| {r.rent_id:<6} | {r.car_id:<7} | C{r.cust_id:<10} | {_fmt_day(r.pickup_ts)} | {_fmt_day(r.pickup_ts, r.days)} | {r.days:<4} | {('Yes' if r.is_returned else 'No'):<8} |")
+    lines.append('+--------+---------+-------------+------------+------------+------+----------+')
+    lines.append('')
+
+    # Section C: Car summary (reuse your existing summary logic)
+    lines.append('=== Report C: Car Summary (Active only) ===')
+    lines.append('+-------+------------+-----------+-----------+------+------------+---------+')
+    lines.append('| CarID | Plate      | Brand     | Model     | Year | Rate (THB) | Status  |')
+    lines.append('+-------+------------+-----------+-----------+------+------------+---------+')
+    # one pass over the loaded cars collects the active rows, rented count, rate
+    # stats and brand tally (raw brand bytes -> [count, lowest car_id])
+    car_list = []
+    rented = 0
+    rate_sum = 0.0
+    rate_min = rate_max = 0.0
+    raw_brands = {}
+    for c in cars.values():
+        if c.status != 1:
+            continue
+        car_list.append(c)
+        rented += c.is_rented == 1
+        rate = c.daily_rate_thb
+        rate_sum += rate
+        if len(car_list) == 1 or rate < rate_min:
+            rate_min = rate
+        if len(car_list) == 1 or rate > rate_max:
+            rate_max = rate
+        t = raw_brands.get(c.brand)
+        if t is None:
+            raw_brands[c.brand] = [1, c.car_id]
+        else:
+            t[0] += 1
+            if c.car_id < t[1]:
+                t[1] = c.car_id
+    car_list.sort(key=lambda x: x.car_id)
+    for c in car_list:
+        lines.append(_REPORT_CAR_ROW_FMT.format(c.car_id, fixed_bytes_to_str(c.license_plate), fixed_bytes_to_str(c.brand),
+                                                fixed_bytes_to_str(c.model), c.year, c.daily_rate_thb, 'Active'))
+    lines.append('+-------+------------+-----------+-----------+------+------------+---------+')
+    lines.append('')
+    total = len(car_list)
+    available = total - rented
+    lines.append('Summary:')
+    lines.append(f'- Active Cars     : {total}')
+    lines.append(f'- Currently Rented: {rented}')
+    lines.append(f'- Available Now   : {available}')
+    if car_list:
+        lines.append(f'- Rate Min/Max/Avg: {rate_min:.2f} / {rate_max:.2f} / {rate_sum/total:.2f}')
+    # Cars by brand: decode once per distinct raw brand; ties keep car_id order
+    brands = {}
+    for raw, (n, first_id) in raw_brands.items():
+        b = fixed_bytes_to_str(raw) or 'Unknown'
+        t = brands.setdefault(b, [0, first_id])
+        t[0] += n
+        t[1] = min(t[1], first_id)
+    if brands:
+        lines.append('')
+        lines.append('Cars by Brand:')
+        for k,(v, _) in sorted(brands.items(), key=lambda x: (-x[1][0], x[1][1])):
+            lines.append(f'- {k} : {v}')
+
+    # write report to file
+    with open(REPORT_FILE, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+    print(f"Report written to {REPORT_FILE}. You can open this text file and hand it to your professor.")
+
+# --- Sample data generators ---
+BRANDS = ['Toyota','Honda','Nissan','Mazda','BMW','Mercedes','MG','Isuzu','Ford']
+MODELS = ['Camry','Civic','Almera','2','Fortuner','530e','Yaris','Accord','C300','March']
+
+def create_sample_cars(n: int = 50):
+    import random
+    ensure_file(CARS_FILE, CARS_RECORD_SIZE)
+    meta = read_header(CARS_FILE)
+    start_id = meta.get('next_id', 1001)
+    ts = int(time.time())
+    # pack every record straight into one buffer and append it in a single write
+    buf = bytearray(n * CARS_RECORD_SIZE)
+    for i in range(n):
+        _CAR_STRUCT.pack_into(
+            buf, i * CARS_RECORD_SIZE,
+            start_id + i,
+            1,
+            1 if random.random() < 0.3 else 0,
+            random.randint(2015, 2023),
+            float(random.choice([800,900,1000,1200,1500,1800,2200,2500,3000])),
+            random.randint(5000,150000),
+            str_to_fixed_bytes(''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ', k=3)) + '-' + str(random.randint(1000,9999)), 12),
+            str_to_fixed_bytes(random.choice(BRANDS), 12),
+            str_to_fixed_bytes(random.choice(MODELS), 16),
+            ts,
+            ts
+        )
+    append_records(CARS_FILE, buf, CARS_RECORD_SIZE, durable=False)
+    sync_file(CARS_FILE)
+    print(f'Created {n} sample car records (starting id {start_id})')
+
+def create_sample_customers(n: int = 10):
+    ensure_file(CUST_FILE, CUST_RECORD_SIZE)
+    sample_names = [
+        "Mr. Somchai Jaidee","Ms. Kamoltip Nimnuan","Mr. Anan Srisuk",
+        "Ms. Lina Park","Mr. John Smith","Ms. Anna Lee","Mr. David Brown",
+        "Ms. Sara Kim","Mr. Tom Jones","Ms. Maria Gomez"
+    ]
+    meta = read_header(CUST_FILE)
+    start_id = meta.get('next_id', 1001)
+    ts = int(time.time())
+    buf = bytearray(n * CUST_RECORD_SIZE)
+    for i in range(n):
+        cid = start_id + i
+        name = sample_names[i % len(sample_names)]
+        _CUST_STRUCT.pack_into(
+            buf, i * CUST_RECORD_SIZE,
+            cid,
+            1,
+            str_to_fixed_bytes(name, 32),
+            str_to_fixed_bytes(f'080-000-{1000 + i}', 16),
+            str_to_fixed_bytes(f'user{cid}@example.com', 32),
+            ts,
+            ts
+        )
+    append_records(CUST_FILE, buf, CUST_RECORD_SIZE, durable=False)
+    sync_file(CUST_FILE)
+    print(f'Created {n} sample customers (starting id {start_id})')
+
+def create_sample_rentals(n: int = 10):
+    import random
+    ensure_file(RENT_FILE, RENT_RECORD_SIZE)
+    # we need cars and customers to exist
+    ensure_file(CARS_FILE, CARS_RECORD_SIZE)
+    ensure_file(CUST_FILE, CUST_RECORD_SIZE)
+    cars_meta = read_header(CARS_FILE); cars_count = cars_meta.get('count', 0)
+    cust_meta = read_header(CUST_FILE); cust_count = cust_meta.get('count', 0)
+    if cars_count == 0 or cust_count == 0:
+        print("Please create sample cars and customers first.")
+        return
+    # one pass over the cars for ids and rates; the first record wins for a duplicated id
+    car_ids = []
+    rate_by_id = {}
+    for car_id, _, _, _, rate, *_ in _CAR_STRUCT.iter_unpack(_read_data(CARS_FILE, CARS_RECORD_SIZE)):
+        car_ids.append(car_id)
+        rate_by_id.setdefault(car_id, rate)
+    mm = _record_file(CUST_FILE, CUST_RECORD_SIZE).mm
+    cust_ids = [_ID_STRUCT.unpack_from(mm, HEADER_SIZE + i * CUST_RECORD_SIZE)[0]
+                for i in range(_mapped_count(mm, cust_count, CUST_RECORD_SIZE))]
+
+    meta = read_header(RENT_FILE)
+    start_id = meta.get('next_id', 1001)
+    base = datetime.date.today() - datetime.timedelta(days=30)
+    buf = bytearray(n * RENT_RECORD_SIZE)
+    rented = set()
+    for i in range(n):
+        car_id = random.choice(car_ids)
+        cust_id = random.choice(cust_ids)
+        pickup = base + datetime.timedelta(days=random.randint(0, 25))
+        days = random.choice([1,2,3,4,5,6,7])
+        pickup_ts = int(time.mktime(pickup.timetuple()))
+        _RENT_STRUCT.pack_into(buf, i * RENT_RECORD_SIZE,
+                               start_id + i, 1, car_id, cust_id, pickup_ts, rate_by_id[car_id], days, 0)
+        rented.add(car_id)
+    append_records(RENT_FILE, buf, RENT_RECORD_SIZE, durable=False)
+    # mark the rented cars by patching just their is_rented/updated_at fields in place
+    car_index = _get_id_index(CARS_FILE, CARS_RECORD_SIZE)
+    mm = _record_file(CARS_FILE, CARS_RECORD_SIZE).mm
+    ts = int(time.time())
+    for car_id in rented:
+        off = get_record_offset(car_index[car_id], CARS_RECORD_SIZE)
+        _ID_STRUCT.pack_into(mm, off + _CAR_IS_RENTED_OFFSET, 1)
+        _ID_STRUCT.pack_into(mm, off + _CAR_UPDATED_AT_OFFSET, ts)
+    _touch_header(CARS_FILE, read_header(CARS_FILE))
+    sync_file(RENT_FILE)
+    sync_file(CARS_FILE)
+    print(f'Created {n} sample rentals (starting id {start_id})')
+
+# --- Initialization and main menu ---
+DATA_FILES = ((CARS_FILE, CARS_RECORD_SIZE), (CUST_FILE, CUST_RECORD_SIZE), (RENT_FILE, RENT_RECORD_SIZE))
+
+@functools.lru_cache(maxsize=1)
+def initialize_all_files():
+    # one directory listing instead of an exists() check per data file
+    with os.scandir('.') as it:
+        present = {e.name for e in it if e.is_file()}
+    for filename, record_size in DATA_FILES:
+        if filename not in present:
+            ensure_file(filename, record_size)
+    print('Initialized files (if not present).')
+
+MENU = '''
+Main Menu:
+1) Add Car
+2) Update Car
+3) Delete Car (logical)
+4a) View one car
+4b) View all cars
+4c) View only Active cars
+4d) View only Deleted cars
+5) Generate Report (3 examples -> report.txt)
+6) Create Sample Data
+7) Customers (view/add)
+8) Rentals (view/add)
+0) Exit
+Choose: '''
+
+# Submenu texts are emitted with one write each instead of a print() per line
+SAMPLE_SUBMENU = (
+    'Sample Data Menu:\n'
+    '1) Create 50 sample cars\n'
+    '2) Create 10 sample customers\n'
+    '3) Create 20 sample rentals (requires sample cars & customers)\n'
+    '0) Back\n'
+)
+CUSTOMERS_SUBMENU = (
+    'Customers Menu:\n'
+    '1) View all customers\n'
+    '2) Add a customer (interactive)\n'
+    '0) Back\n'
+)
+RENTALS_SUBMENU = (
+    'Rentals Menu:\n'
+    '1) View all rentals\n'
+    '2) Add a rental (interactive)\n'
+    '0) Back\n'
+)
+
+def _show(text: str):
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+# One-character answers, optionally padded with whitespace
+_SAMPLE_RE = re.compile(r'\A\s*([0-3])\s*\Z')
+_SUB_RE = re.compile(r'\A\s*([0-2])\s*\Z')
+
+def _read_choice(prompt: str, pattern: re.Pattern):
+    """Return the canonical key typed at prompt, or None if pattern does not match."""
+    m = pattern.match(input(prompt))
+    return None if m is None else m.group(1)
+
+def add_customer_interactive():
+    name = input('Name: ').strip()
+    phone = input('Phone: ').strip()
+    email = input('Email: ').strip()
+    cid = add_customer(name, phone, email)
+    print(f'Added customer id {cid}')
+
+def add_rental_interactive():
+    try:
+        car_id = int(input('Car ID: ').strip())
+        cust_id = int(input('Customer ID: ').strip())
+        pickup_str = input('Pick-up date (YYYY-MM-DD): ').strip()
+        days = int(input('Days: ').strip())
+        pickup_dt = datetime.datetime.strptime(pickup_str, '%Y-%m-%d').date()
+        # get car rate if exists
+        idx = find_car_index_by_id(car_id)
+        rate = 1000.0
+        if idx is not None:
+            rate = unpack_car(read_record_at(CARS_FILE, idx, CARS_RECORD_SIZE)).daily_rate_thb
+        rid = add_rental(car_id, cust_id, pickup_dt, days, rate)
+        print(f'Added rental id {rid}')
+    except Exception as e:
+        print('Invalid input or error:', e)
+
+# --- Menu dispatch ---
+# Every menu, main or sub, is a table of key -> handler. A handler returns None to
+# carry on, and only _exit_handler returns the _EXIT sentinel that ends the loop.
+_EXIT = object()
+
+def _exit_handler():
+    print('Exiting. Bye.')
+    return _EXIT
+
+def _back():
+    return None
+
+SAMPLE_HANDLERS = {
+    '1': lambda: create_sample_cars(50),
+    '2': lambda: create_sample_customers(10),
+    '3': lambda: create_sample_rentals(20),
+    '0': _back,
+}
+CUSTOMERS_HANDLERS = {
+    '1': view_all_customers,
+    '2': add_customer_interactive,
+    '0': _back,
+}
+RENTALS_HANDLERS = {
+    '1': view_all_rentals,
+    '2': add_rental_interactive,
+    '0': _back,
+}
+
+def _run_submenu(text: str, pattern: re.Pattern, handlers: dict):
+    _show(text)
+    handler = handlers.get(_read_choice('Choice: ', pattern))
+    if handler is not None:  # unknown keys go back to the main menu, as '0' does
+        handler()
+
+def sample_data_menu():
+    _run_submenu(SAMPLE_SUBMENU, _SAMPLE_RE, SAMPLE_HANDLERS)
+
+def customers_menu():
+    _run_submenu(CUSTOMERS_SUBMENU, _SUB_RE, CUSTOMERS_HANDLERS)
+
+def rentals_menu():
+    _run_submenu(RENTALS_SUBMENU, _SUB_RE, RENTALS_HANDLERS)
+
+# keys are interned so a lookup with an interned choice hits the identity check first
+HANDLERS = {sys.intern(k): v for k, v in {
+    '1': add_car_interactive,
+    '2': update_car_interactive,
+    '3': delete_car_interactive,
+    '4a': view_one_car,
+    '4b': lambda: view_all_cars(None),
+    '4c': lambda: view_all_cars(True),
+    '4d': lambda: view_all_cars(False),
+    '5': generate_report_all,
+    '6': sample_data_menu,
+    '7': customers_menu,
+    '8': rentals_menu,
+    '0': _exit_handler,
+}.items()}
+
+# a single digit, or 4 followed by the view letter (4a-4d)
+_CHOICE_RE = re.compile(r'\A\s*([0-35-8]|4[a-dA-D])\s*\Z')
+
+def _menu_key(m: re.Match) -> str:
+    key = m.group(1)
+    if len(key) == 2:
+        key = key[0] + chr(ord(key[1]) | 0x20)
+    return sys.intern(key)
+
+_UNKNOWN = b'Unknown choice\n'
+
+# checked once: piped stdin runs in batch mode, without the menu or readline
+INTERACTIVE = sys.stdin is not None and sys.stdin.isatty()
+
+# The keyword defaults bind the per-line lookups as locals once, at definition time
+# (HANDLERS is mutated in place, never rebound, so binding its .get is safe).
+def _dispatch(line: str, _match=_CHOICE_RE.match, _key=_menu_key, _get=HANDLERS.get,
+              _write=os.write, _unknown=_UNKNOWN):
+    """Run the handler for one main-menu line and return its result (_EXIT to stop)."""
+    m = _match(line)
+    handler = _get(_key(m)) if m else None
+    if handler is None:
+        sys.stdout.flush()  # usually empty after input(); keeps the raw write in order
+        _write(1, _unknown)
+        return None
+    return handler()
+
+def start_session():
+    initialize_all_files()
+    load_state()
+    atexit.register(save_state)  # runs before the flush_headers hook, and flushes itself
+
+def _batch_loop():
+    # commands piped in by a script: no menu text, just one readline per command
+    dispatch, exit_ = _dispatch, _EXIT
+    for line in iter(sys.stdin.readline, ''):
+        if dispatch(line) is exit_:
+            break
+
+def batch_main():
+    start_session()
+    _batch_loop()
@@ -0,0 +1,88 @@
+"""Terminal session for the car rental menu: prompt loop and readline.
+
+Only loaded when stdin is a terminal; piped input runs carrental.cli.batch_main.
+"""
+
+from __future__ import annotations
+import atexit
+import os
+try:
+    import readline  # line editing and history for input(); not available on Windows
+except ImportError:
+    readline = None
+
+from .cli import HANDLERS, MENU, STATE_DIR, _CHOICE_RE, _EXIT, _dispatch, _show, start_session
+
+def _prompt_loop():
+    """Menu loop for a terminal session.
+
+    The line is read with input() on the main thread, so Ctrl-C at the prompt is a
+    plain KeyboardInterrupt everywhere. (A reader thread gets an EOFError from a
+    Windows console instead.) The main thread also makes readline throw away the
+    half-typed line. Nothing needs saving between prompts: handlers sync every write
+    as they make it, and the remaining dirty headers are flushed at exit.
+    """
+    dispatch, menu, exit_ = _dispatch, MENU, _EXIT
+    remember = _remember if readline is not None else None
+    while True:
+        try:
+            line = input(menu)
+        except KeyboardInterrupt:
+            # a stray Ctrl-C at the menu keeps the session (and its caches) alive
+            _show('\n(use 0 to exit)\n')
+            continue
+        if remember is not None:
+            remember(line)
+        if dispatch(line) is exit_:
+            break
+
+# --- Line editing ---
+# Only main-menu keys go into the history. Submenu answers include customer names,
+# phones and emails, which must not be written to .cache/.history or offered back
+# by up-arrow, so automatic history is off and menu lines are added explicitly.
+HISTORY_FILE = os.path.join(STATE_DIR, '.history')
+HISTORY_LENGTH = 200
+
+def _remember(line: str):
+    if _CHOICE_RE.match(line):
+        readline.add_history(line.strip())
+
+def _drop_non_menu_history():
+    # history files written before auto history was turned off may hold other answers
+    for i in range(readline.get_current_history_length(), 0, -1):
+        item = readline.get_history_item(i)
+        if item is None or not _CHOICE_RE.match(item):
+            readline.remove_history_item(i - 1)
+
+def _complete_choice(text: str, state: int) -> str | None:
+    matches = [k for k in HANDLERS if k.startswith(text)]
+    return matches[state] if state < len(matches) else None
+
+def _save_history():
+    try:
+        os.makedirs(STATE_DIR, exist_ok=True)
+        readline.write_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+
+def setup_readline():
+    if readline is None:
+        return
+    readline.set_auto_history(False)
+    readline.set_history_length(HISTORY_LENGTH)
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+    _drop_non_menu_history()
+    readline.set_completer(_complete_choice)
+    if 'libedit' in (readline.__doc__ or ''):
+        readline.parse_and_bind('bind ^I rl_complete')  # macOS ships libedit
+    else:
+        readline.parse_and_bind('tab: complete')
+    atexit.register(_save_history)
+
+def main_loop():
+    start_session()
+    setup_readline()
+    _prompt_loop()
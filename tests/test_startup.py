@@ -0,0 +1,46 @@
+"""Startup import checks for the carrental package.
+
+Each check runs in a fresh interpreter so modules imported by the test runner
+itself cannot hide a regression.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _loaded_after(statement, modules):
+    code = (f'import sys\n{statement}\n'
+            f'print(" ".join(m for m in {sorted(modules)!r} if m in sys.modules))')
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return out.split()
+
+
+class DeferredImportTest(unittest.TestCase):
+    def test_cli_import_defers_json_and_random(self):
+        # json and random are imported inside the few menu paths that use them
+        self.assertEqual(_loaded_after('import carrental.cli', ('json', 'random')), [])
+
+    def test_interactive_import_does_not_load_asyncio(self):
+        # the terminal session is one synchronous loop on the main thread
+        self.assertEqual(_loaded_after('import carrental.interactive', ('asyncio', 'threading')), [])
+
+    def test_batch_run_does_not_load_readline(self):
+        # piped stdin takes the batch path, which has no line editing
+        code = ('import runpy, sys\n'
+                'runpy.run_module("carrental", run_name="__main__")\n'
+                'print([m for m in ("asyncio", "readline") if m in sys.modules], file=sys.stderr)')
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        with tempfile.TemporaryDirectory() as tmp:
+            proc = subprocess.run([sys.executable, '-c', code], cwd=tmp, env=env, input='0\n',
+                                  check=True, capture_output=True, text=True)
+        self.assertIn('Exiting. Bye.', proc.stdout)
+        self.assertEqual(proc.stderr.strip(), '[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+"""On-disk format checks for the .dat files and the .cache/state.bin index cache.
+
+Each step runs in a fresh interpreter inside a temporary working directory, so
+the module-level header, id index and free-slot caches start empty every time,
+just as they do when the program starts.
+"""
+import ast
+import json
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from carrental import cli  # noqa: E402  (only constants and pure helpers are used here)
+
+
+def _run(cwd, code, stdin=''):
+    """Run code with cli imported in cwd and return the value it passes to out()."""
+    script = ('import sys\nfrom carrental import cli\n'
+              'def out(value): print(repr(value), file=sys.stderr)\n' + code)
+    proc = subprocess.run([sys.executable, '-c', script], cwd=cwd, input=stdin,
+                          env=dict(os.environ, PYTHONPATH=ROOT),
+                          check=True, capture_output=True, text=True)
+    return ast.literal_eval(proc.stderr.strip().splitlines()[-1])
+
+
+def _car_bytes(car_id, status=1, plate='AB-1'):
+    car = cli.car_from_dict({'car_id': car_id, 'status': status, 'is_rented': 0, 'year': 2021,
+                             'daily_rate_thb': 1000.0, 'odometer_km': 0, 'license_plate': plate,
+                             'brand': 'Toyota', 'model': 'Yaris', 'created_at': 0, 'updated_at': 0})
+    return cli.pack_car(car)
+
+
+def _write_struct_file(path, record_size, records):
+    meta = {'record_size': record_size, 'count': len(records), 'next_id': 1001 + len(records),
+            'capacity': len(records), 'free_count': 0}
+    with open(path, 'wb') as f:
+        f.write(cli._pack_header(meta).ljust(cli.HEADER_SIZE, b'\x00'))
+        f.write(b''.join(records))
+
+
+def _header(path):
+    with open(path, 'rb') as f:
+        data = f.read(cli.HEADER_SIZE)
+    if data[:8] != cli._HDR_MAGIC:
+        return None
+    return dict(zip(cli._HDR_FIELDS, cli._HDR.unpack_from(data)[1:]))
+
+
+# answers for add_car_interactive: year, rate, odometer, plate, brand, model
+_NEW_CAR = '2022\n1500\n10\nNEW-1\nHonda\nCity\n'
+
+
+class LegacyHeaderTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        # a cars.dat as written before the struct header: JSON, zero padded
+        meta = {'version': '1.0', 'record_size': cli.CARS_RECORD_SIZE, 'created_at': 0,
+                'count': 2, 'next_id': 1003, 'free_list': []}
+        self.path = os.path.join(self.tmp.name, cli.CARS_FILE)
+        with open(self.path, 'wb') as f:
+            f.write(json.dumps(meta).encode('utf-8').ljust(cli.HEADER_SIZE, b'\x00'))
+            f.write(_car_bytes(1001) + _car_bytes(1002))
+
+    def test_json_header_is_read_and_rewritten_as_struct(self):
+        found = _run(self.tmp.name, 'out((cli.find_car_index_by_id(1001), cli.find_car_index_by_id(1002)))\n'
+                                    'cli.flush_headers()')
+        self.assertEqual(found, (0, 1))
+        header = _header(self.path)
+        self.assertIsNotNone(header)
+        self.assertEqual((header['count'], header['next_id']), (2, 1003))
+        # the migrated file still reads the same in the next session
+        self.assertEqual(_run(self.tmp.name, 'out(cli.find_car_index_by_id(1002))'), 1)
+
+    def test_json_header_is_ignored_without_migration(self):
+        found = _run(self.tmp.name, 'cli.MIGRATE_JSON_HEADERS = False\n'
+                                    'out((cli.read_header(cli.CARS_FILE), cli.find_car_index_by_id(1001)))\n'
+                                    'cli.flush_headers()')
+        self.assertEqual(found, ({}, None))
+        self.assertIsNone(_header(self.path))
+
+
+class SlotTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cars = os.path.join(self.tmp.name, cli.CARS_FILE)
+
+    def test_append_doubles_capacity(self):
+        n = cli.RecordFile.MIN_CAPACITY + 1
+        _run(self.tmp.name, f'for i in range({n}):\n'
+                            f'    cli.append_car(cli.unpack_car({_car_bytes(0)!r})._replace(car_id=1001 + i))\n'
+                            'out(None)')
+        header = _header(self.cars)
+        capacity = 2 * cli.RecordFile.MIN_CAPACITY
+        self.assertEqual((header['count'], header['next_id'], header['capacity']), (n, 1001 + n, capacity))
+        self.assertEqual(os.path.getsize(self.cars), cli.HEADER_SIZE + capacity * cli.CARS_RECORD_SIZE)
+        self.assertEqual(_run(self.tmp.name, f'out(cli.find_car_index_by_id({1000 + n}))'), n - 1)
+
+    def test_add_reuses_the_slot_of_a_deleted_car(self):
+        _write_struct_file(self.cars, cli.CARS_RECORD_SIZE, [_car_bytes(1001), _car_bytes(1002), _car_bytes(1003)])
+        found = _run(self.tmp.name, 'cli.delete_car_interactive()\n'
+                                    'cli.add_car_interactive()\n'
+                                    'out([cli.find_car_index_by_id(i) for i in (1002, 1004)])',
+                     stdin='1002\n' + _NEW_CAR)
+        self.assertEqual(found, [None, 1])
+        self.assertEqual(_header(self.cars)['count'], 3)
+        # an index rebuilt from disk agrees with the one updated in place
+        self.assertEqual(_run(self.tmp.name, 'out([cli.find_car_index_by_id(i) for i in (1002, 1004)])'),
+                         [None, 1])
+
+    def test_add_keeps_a_deleted_car_that_rentals_name(self):
+        _write_struct_file(self.cars, cli.CARS_RECORD_SIZE, [_car_bytes(1001), _car_bytes(1002, status=0)])
+        rental = cli.pack_rental(cli.Rental(1001, 1, 1002, 1001, 0, 1000.0, 1, 1))
+        _write_struct_file(os.path.join(self.tmp.name, cli.RENT_FILE), cli.RENT_RECORD_SIZE, [rental])
+        found = _run(self.tmp.name, 'cli.add_car_interactive()\n'
+                                    'out([cli.find_car_index_by_id(i) for i in (1002, 1003)])',
+                     stdin=_NEW_CAR)
+        self.assertEqual(found, [1, 2])
+
+
+class StateCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cars = os.path.join(self.tmp.name, cli.CARS_FILE)
+        self.state = os.path.join(self.tmp.name, cli.STATE_FILE)
+        _write_struct_file(self.cars, cli.CARS_RECORD_SIZE, [_car_bytes(1001), _car_bytes(1002)])
+        _run(self.tmp.name, 'cli.start_session()\nout(cli.find_car_index_by_id(1001))')
+
+    def _loaded(self):
+        return _run(self.tmp.name, 'cli.load_state()\nout(cli._id_index.get(cli.CARS_FILE))')
+
+    def test_matching_cache_is_loaded(self):
+        self.assertEqual(self._loaded(), {1001: 0, 1002: 1})
+
+    def test_damaged_cache_is_ignored(self):
+        with open(self.state, 'r+b') as f:
+            f.truncate(os.path.getsize(self.state) - 3)
+        with open(self.state, 'rb') as f:
+            with self.assertRaises(Exception):
+                cli._parse_state(f.read())
+        self.assertIsNone(self._loaded())
+
+    def test_slot_past_the_end_is_rejected(self):
+        with open(self.state, 'r+b') as f:
+            f.seek(-cli._STATE_PAIR.size, os.SEEK_END)
+            f.write(cli._STATE_PAIR.pack(1002, 2))
+        with open(self.state, 'rb') as f:
+            with self.assertRaises(ValueError):
+                cli._parse_state(f.read())
+        self.assertIsNone(self._loaded())
+
+    def test_cache_is_stale_after_header_change_with_same_mtime(self):
+        # rewrite the header count in place and put the old mtime back: only the
+        # counters in the stamp can tell that the file changed
+        st = os.stat(self.cars)
+        with open(self.cars, 'r+b') as f:
+            f.seek(struct.calcsize('<8s I'))
+            f.write(struct.pack('<I', 1))
+        os.utime(self.cars, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertIsNone(self._loaded())
+
+
+if __name__ == '__main__':
+    unittest.main()